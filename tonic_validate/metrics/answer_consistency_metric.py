@@ -3,16 +3,13 @@ from typing import Any, Dict, Union
 from tonic_validate.classes.llm_response import LLMResponse
 from tonic_validate.metrics.metric import Metric, MetricRequirement
 from tonic_validate.utils.metrics_util import (
-    parse_boolean_response,
-    parse_bullet_list_response,
+    parse_main_points_with_derivation_response,
 )
 from tonic_validate.services.openai_service import OpenAIService
 from tonic_validate.services.litellm_service import LiteLLMService
 from tonic_validate.utils.llm_calls import (
-    main_points_call,
-    statement_derived_from_context_call,
-    statement_derived_from_context_prompt,
-    main_points_prompt,
+    main_points_with_derivation_call,
+    main_points_with_derivation_prompt,
 )
 
 logger = logging.getLogger()
@@ -22,9 +19,7 @@ class AnswerConsistencyMetric(Metric):
     name: str = "answer_consistency"
     prompt: str = (
         "-------------------\n"
-        f"{main_points_prompt()}\n"
-        "-------------------\n"
-        f"{statement_derived_from_context_prompt(statement='EXAMPLE STATEMENT', context_list=[])}\n"
+        f"{main_points_with_derivation_prompt(answer='EXAMPLE ANSWER', context_list=[])}\n"
         "-------------------\n"
     )
     requirements = {MetricRequirement.LLM_ANSWER, MetricRequirement.LLM_CONTEXT}
@@ -48,18 +43,15 @@ class AnswerConsistencyMetric(Metric):
         llm_response: LLMResponse,
         llm_service: Union[LiteLLMService, OpenAIService],
     ) -> float:
-        main_points_response = await main_points_call(
-            llm_response.llm_answer, llm_service
+        # Finds the main points and checks each against the context in one request,
+        # rather than one request for the main points and then one per main point
+        main_points_response = await main_points_with_derivation_call(
+            llm_response.llm_answer, llm_response.llm_context_list, llm_service
+        )
+        main_point_list = parse_main_points_with_derivation_response(
+            main_points_response
         )
-        main_point_list = parse_bullet_list_response(main_points_response)
-        main_point_derived_from_context_list = []
-        for main_point in main_point_list:
-            statement_derived_from_context_response = (
-                await statement_derived_from_context_call(
-                    main_point, llm_response.llm_context_list, llm_service
-                )
-            )
-            main_point_derived_from_context_list.append(
-                parse_boolean_response(statement_derived_from_context_response)
-            )
+        main_point_derived_from_context_list = [
+            derived for _, derived in main_point_list
+        ]
         return sum(main_point_derived_from_context_list) / len(main_point_list)
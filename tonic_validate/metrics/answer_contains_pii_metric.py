@@ -6,6 +6,7 @@ from tonic_validate.metrics.binary_metric import BinaryMetric
 from tonic_validate.metrics.metric import Metric, MetricRequirement
 from tonic_validate.services.openai_service import OpenAIService
 from tonic_validate.services.litellm_service import LiteLLMService
+from tonic_validate.utils.textual_client import get_textual_client
 
 
 class AnswerContainsPiiMetric(BinaryMetric):
@@ -26,25 +27,25 @@ class AnswerContainsPiiMetric(BinaryMetric):
 
         """
         try:
-            from tonic_textual.redact_api import TonicTextual  # type: ignore
+            from tonic_textual.redact_api import TonicTextual  # type: ignore # noqa: F401
         except ImportError:
             raise ImportError(
                 "You must install tonic-textual to use the AnswerContainsPiiMetric. You can install it via pip: pip install tonic-textual"
             )
-        self.pii_types = [p.lower() for p in pii_types]
-        if textual_api_key is None:
-            if os.getenv("TONIC_TEXTUAL_API_KEY") is None:
-                raise ValueError(
-                    "You must set TONIC_TEXTUAL_API_KEY in your ENV or pass your Textual API key into the constructor."
-                )
-            self.textual = TonicTextual("https://textual.tonic.ai")
-        else:
-            self.textual = TonicTextual("https://textual.tonic.ai", textual_api_key)
+        self.pii_types = frozenset(p.lower() for p in pii_types)
+        if textual_api_key is None and os.getenv("TONIC_TEXTUAL_API_KEY") is None:
+            raise ValueError(
+                "You must set TONIC_TEXTUAL_API_KEY in your ENV or pass your Textual API key into the constructor."
+            )
+        self.textual = get_textual_client(textual_api_key)
 
         super().__init__("answer_contains_pii", self.metric_callback)
 
     def serialize_config(self):
-        return {"pii_types": self.pii_types, "textual_api_key": self.textual.api_key}
+        return {
+            "pii_types": sorted(self.pii_types),
+            "textual_api_key": self.textual.api_key,
+        }
 
     @staticmethod
     def from_config(config: Dict[str, Any]) -> Metric:
@@ -60,10 +61,9 @@ class AnswerContainsPiiMetric(BinaryMetric):
     ) -> bool:
         try:
             response = self.textual.redact(llm_response.llm_answer)
-            for d in response.de_identify_results:
-                if d.label.lower() in self.pii_types:
-                    return True
-            return False
+            return any(
+                d.label.lower() in self.pii_types for d in response.de_identify_results
+            )
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
                 raise ValueError(
@@ -5,6 +5,7 @@ from tonic_validate.metrics.metric import Metric, MetricRequirement
 from tonic_validate.utils.metrics_util import parse_boolean_response
 from tonic_validate.services.openai_service import OpenAIService
 from tonic_validate.services.litellm_service import LiteLLMService
+from tonic_validate.utils.parallel import gather_bounded
 from tonic_validate.utils.llm_calls import (
     answer_contains_context_call,
     answer_contains_context_prompt,
@@ -44,18 +45,22 @@ class AugmentationAccuracyMetric(Metric):
         llm_response: LLMResponse,
         llm_service: Union[LiteLLMService, OpenAIService],
     ) -> Tuple[float, List[bool]]:
-        contains_context_list: List[bool] = []
         if len(llm_response.llm_context_list) == 0:
             raise ValueError(
                 "No context provided, cannot calculate augmentation accuracy"
             )
-        for context in llm_response.llm_context_list:
-            contains_context_response = await answer_contains_context_call(
-                llm_response.llm_answer, context, llm_service
-            )
-            contains_context_list.append(
-                parse_boolean_response(contains_context_response)
-            )
+        contains_context_responses = await gather_bounded(
+            [
+                answer_contains_context_call(
+                    llm_response.llm_answer, context, llm_service
+                )
+                for context in llm_response.llm_context_list
+            ],
+            limit=llm_service.max_concurrency,
+        )
+        contains_context_list: List[bool] = [
+            parse_boolean_response(response) for response in contains_context_responses
+        ]
 
         score = sum(contains_context_list) / len(contains_context_list)
         return (score, contains_context_list)
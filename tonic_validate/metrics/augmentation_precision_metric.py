@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Union
 from tonic_validate.classes.llm_response import LLMResponse
@@ -38,13 +39,11 @@ class AugmentationPrecisionMetric(Metric):
         llm_response: LLMResponse,
         llm_service: Union[LiteLLMService, OpenAIService],
     ) -> float:
-        retrieval_precision_score = await self.retrieval_precision.calculate_metric(
-            llm_response, llm_service
+        retrieval_precision_score, augmentation_accuracy_score = await asyncio.gather(
+            self.retrieval_precision.calculate_metric(llm_response, llm_service),
+            self.augmentation_accuracy.calculate_metric(llm_response, llm_service),
         )
         context_relevant_list = retrieval_precision_score[1]
-        augmentation_accuracy_score = await self.augmentation_accuracy.calculate_metric(
-            llm_response, llm_service
-        )
         contains_context_list = augmentation_accuracy_score[1]
 
         return self.score_from_context_labels(
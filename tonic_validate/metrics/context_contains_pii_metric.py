@@ -1,4 +1,6 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from typing import Any, Dict, List, Optional, Union
 from tonic_validate.classes.llm_response import LLMResponse
@@ -6,6 +8,11 @@ from tonic_validate.metrics.binary_metric import BinaryMetric
 from tonic_validate.metrics.metric import Metric, MetricRequirement
 from tonic_validate.services.openai_service import OpenAIService
 from tonic_validate.services.litellm_service import LiteLLMService
+from tonic_validate.utils.textual_client import get_textual_client
+
+# Textual calls are blocking, so they run on these threads to check several pieces of
+# context at once without blocking the event loop
+_textual_executor = ThreadPoolExecutor(max_workers=8)
 
 
 class ContextContainsPiiMetric(BinaryMetric):
@@ -26,25 +33,25 @@ class ContextContainsPiiMetric(BinaryMetric):
 
         """
         try:
-            from tonic_textual.redact_api import TonicTextual  # type: ignore
+            from tonic_textual.redact_api import TonicTextual  # type: ignore # noqa: F401
         except ImportError:
             raise ImportError(
                 "You must install tonic-textual to use the ContextContainsPiiMetric. You can install it via pip: pip install tonic-textual"
             )
-        self.pii_types = [p.lower() for p in pii_types]
-        if textual_api_key is None:
-            if os.getenv("TONIC_TEXTUAL_API_KEY") is None:
-                raise ValueError(
-                    "You must set TONIC_TEXTUAL_API_KEY in your ENV or pass your Textual API key into the constructor."
-                )
-            self.textual = TonicTextual("https://textual.tonic.ai")
-        else:
-            self.textual = TonicTextual("https://textual.tonic.ai", textual_api_key)
+        self.pii_types = frozenset(p.lower() for p in pii_types)
+        if textual_api_key is None and os.getenv("TONIC_TEXTUAL_API_KEY") is None:
+            raise ValueError(
+                "You must set TONIC_TEXTUAL_API_KEY in your ENV or pass your Textual API key into the constructor."
+            )
+        self.textual = get_textual_client(textual_api_key)
 
         super().__init__("context_contains_pii", self.metric_callback)
 
     def serialize_config(self):
-        return {"pii_types": self.pii_types, "textual_api_key": self.textual.api_key}
+        return {
+            "pii_types": sorted(self.pii_types),
+            "textual_api_key": self.textual.api_key,
+        }
 
     @staticmethod
     def from_config(config: Dict[str, Any]) -> Metric:
@@ -53,15 +60,24 @@ class ContextContainsPiiMetric(BinaryMetric):
             textual_api_key=config["textual_api_key"],
         )
 
-    def metric_callback(
+    async def metric_callback(
         self,
         llm_response: LLMResponse,
         llm_service: Union[LiteLLMService, OpenAIService],
     ) -> bool:
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(_textual_executor, self.textual.redact, context)
+            for context in llm_response.llm_context_list
+        ]
         try:
-            response = self.textual.redact("\n".join(llm_response.llm_context_list))
-            for d in response.de_identify_results:
-                if d.label.lower() in self.pii_types:
+            # Stop as soon as any piece of context contains PII
+            for future in asyncio.as_completed(futures):
+                response = await future
+                if any(
+                    d.label.lower() in self.pii_types
+                    for d in response.de_identify_results
+                ):
                     return True
             return False
         except requests.exceptions.HTTPError as e:
@@ -69,6 +85,11 @@ class ContextContainsPiiMetric(BinaryMetric):
                 raise ValueError(
                     "Cannot compute ContextContainsPiiMetric. Your Textual API Key is INVALID."
                 )
+        finally:
+            for future in futures:
+                if not future.cancel() and not future.cancelled():
+                    # Mark errors from futures that were never awaited as retrieved
+                    future.exception()
         raise ValueError(
             "Cannot compute ContextContainsPiiMetric. Error occured communicating with Textual.  Please try again later or reach out via GitHub issues."
         )
@@ -9,6 +9,7 @@ from tonic_validate.utils.llm_calls import (
     context_relevancy_prompt,
 )
 from tonic_validate.services.litellm_service import LiteLLMService
+from tonic_validate.utils.parallel import gather_bounded
 
 logger = logging.getLogger()
 
@@ -48,12 +49,18 @@ class RetrievalPrecisionMetric(Metric):
             raise ValueError(
                 "No context provided, cannot calculate retrieval precision"
             )
-        context_relevant_list: List[bool] = []
-        for context in llm_response.llm_context_list:
-            relevance_response = await context_relevancy_call(
-                llm_response.benchmark_item.question, context, llm_service
-            )
-            context_relevant_list.append(parse_boolean_response(relevance_response))
+        relevance_responses = await gather_bounded(
+            [
+                context_relevancy_call(
+                    llm_response.benchmark_item.question, context, llm_service
+                )
+                for context in llm_response.llm_context_list
+            ],
+            limit=llm_service.max_concurrency,
+        )
+        context_relevant_list: List[bool] = [
+            parse_boolean_response(response) for response in relevance_responses
+        ]
 
         score = sum(context_relevant_list) / len(context_relevant_list)
         return (score, context_relevant_list)
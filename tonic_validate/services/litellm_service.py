@@ -1,18 +1,15 @@
-import asyncio
 import logging
 import os
-import random
+from typing import Dict, List, Optional
 from litellm import acompletion, ModelResponse, Choices
-from openai import APIConnectionError, BadRequestError, RateLimitError
 from tiktoken import Encoding
 
-from tonic_validate.classes.exceptions import LLMException, ContextLengthException
-from tonic_validate.utils.llm_cache import LLMCache
+from tonic_validate.services.llm_service import LLMService
 
-logger = logging.getLogger()
+logger = logging.getLogger(__name__)
 
 
-class LiteLLMService:
+class LiteLLMService(LLMService):
     def __init__(
         self,
         encoder: Encoding,
@@ -21,6 +18,10 @@ class LiteLLMService:
         max_retries: int = 12,
         exp_delay_base: int = 2,
         model_id: str = "",
+        max_concurrency: int = 50,
+        use_cache: bool = True,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
     ) -> None:
         """
         The LiteLLMService class is a wrapper around LiteLLM client for async operations using different LLMs.
@@ -37,18 +38,31 @@ class LiteLLMService:
             The maximum number of retries to attempt.
         exp_delay_base: int
             Base for exponential back off delay between retries.
+        max_concurrency: int
+            The maximum number of requests that can be in flight at once.
+        use_cache: bool
+            Whether to reuse responses for prompts that were already sent.
+        max_requests_per_minute: Optional[int]
+            The request rate limit to stay under. None means no limit.
+        max_tokens_per_minute: Optional[int]
+            The token rate limit to stay under. None means no limit.
         """
         try:
             self.check_environment(model)
         except Exception as e:
-            logger.error(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             raise e
-        self.model = model
-        self.encoder = encoder
-        self.max_retries = max_retries
-        self.exp_delay_base = exp_delay_base
-        self.starting_wait_time = starting_wait_time
-        self.cache = LLMCache()
+        super().__init__(
+            encoder,
+            model,
+            starting_wait_time,
+            max_retries,
+            exp_delay_base,
+            max_concurrency,
+            use_cache,
+            max_requests_per_minute,
+            max_tokens_per_minute,
+        )
         self.model_id = model_id
 
     def check_environment(self, model: str) -> None:
@@ -101,105 +115,33 @@ class LiteLLMService:
         else:
             raise Exception("Model not supported. Please check the model name.")
 
-    async def get_response(self, prompt: str) -> str:
-        """
-        Retrieves a response from the language model
-
-        Parameters
-        ----------
-        prompt: str
-            The prompt to send to the language model.
-
-        Returns
-        -------
-        str
-            The response from the language model.
-        """
-
-        async def get_litellm_response():
-            num_retries = 0
-            wait_time = self.starting_wait_time
-            while num_retries < self.max_retries:
-                random_value = random.randrange(0, 20) * 0.01
-                wait_time_multiplier = self.exp_delay_base * (1 + random_value)
-                try:
-                    messages = [
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant. Respond using markdown.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ]
-                    if self.model_id != "":
-                        response = await acompletion(
-                            model=self.model,
-                            model_id=self.model_id,
-                            messages=messages,
-                            temperature=0.0,
-                        )
-                    else:
-                        response = await acompletion(
-                            model=self.model,
-                            messages=messages,
-                            temperature=0.0,
-                        )
-                    # Check that type is ModelResponse
-                    if not isinstance(response, ModelResponse):
-                        raise Exception(
-                            f"Failed to get response from {self.model}, response is not a ModelResponse"
-                        )
-                    choice = response.choices[0]
-                    if not isinstance(choice, Choices):
-                        raise Exception(
-                            f"Failed to get response from {self.model}, choice is not a Choices object"
-                        )
-                    response_content = choice.message.content
-                    if response_content is None:
-                        raise Exception(
-                            f"Failed to get message response from {self.model}, message does not exist"
-                        )
-                    return response_content
-                except BadRequestError as e:
-                    if e.code == "context_length_exceeded":
-                        raise ContextLengthException(e.message)
-                except APIConnectionError as e:
-                    raise LLMException(e.message)
-                except RateLimitError:
-                    log_message = (
-                        "hit openai.error.RateLimitError and entered retry "
-                        f"logic, num_retries={num_retries}"
-                    )
-                    logger.debug(log_message)
-                    await asyncio.sleep(wait_time)
-                    wait_time *= wait_time_multiplier
-                except Exception as e:
-                    logger.warning(e)
-                    await asyncio.sleep(wait_time)
-                    wait_time *= wait_time_multiplier
-                num_retries += 1
-            raise LLMException(
-                f"Failed to get completion response from {self.model}, max retires hit"
+    async def _create_completion(self, messages: List[Dict[str, str]]) -> str:
+        if self.model_id != "":
+            response = await acompletion(
+                model=self.model,
+                model_id=self.model_id,
+                messages=messages,
+                temperature=0.0,
             )
-
-        cached_response = self.cache.get(prompt)
-        if cached_response is not None:
-            return cached_response
-        response = await get_litellm_response()
-        self.cache.put(prompt, response)
-        return response
-
-    def get_token_count(self, text: str) -> int:
-        """
-        Gets the token count for the given text using the specified encoder.
-
-        Parameters
-        ----------
-        text: str
-            The text to get the token count for.
-
-        Returns
-        -------
-        int
-            The number of tokens in the text.
-        """
-        return len(self.encoder.encode(text))
+        else:
+            response = await acompletion(
+                model=self.model,
+                messages=messages,
+                temperature=0.0,
+            )
+        # Check that type is ModelResponse
+        if not isinstance(response, ModelResponse):
+            raise Exception(
+                f"Failed to get response from {self.model}, response is not a ModelResponse"
+            )
+        choice = response.choices[0]
+        if not isinstance(choice, Choices):
+            raise Exception(
+                f"Failed to get response from {self.model}, choice is not a Choices object"
+            )
+        response_content = choice.message.content
+        if response_content is None:
+            raise Exception(
+                f"Failed to get message response from {self.model}, message does not exist"
+            )
+        return response_content
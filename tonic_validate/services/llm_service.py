@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import random
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List, Optional
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    BadRequestError,
+    RateLimitError,
+)
+from tiktoken import Encoding
+
+from tonic_validate.classes.exceptions import ContextLengthException, LLMException
+from tonic_validate.utils.llm_cache import LLMCache
+from tonic_validate.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant. Respond using markdown."
+
+# Request timeout and conflict, which are retried along with every 5xx status
+RETRYABLE_STATUS_CODES = {408, 409}
+
+
+class LLMService(ABC):
+    def __init__(
+        self,
+        encoder: Encoding,
+        model: str,
+        starting_wait_time: float,
+        max_retries: int,
+        exp_delay_base: int,
+        max_concurrency: int = 50,
+        use_cache: bool = True,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+    ) -> None:
+        """
+        Base class for the LLM services. Handles caching, rate limiting, bounding
+        concurrency and retrying, so that subclasses only need to send a request.
+
+        Parameters
+        ----------
+        encoder: Encoding
+            The encoding to use for token count.
+        model: str
+            The model to use for completions.
+        starting_wait_time: float
+            The starting wait time between retries.
+        max_retries: int
+            The maximum number of retries to attempt.
+        exp_delay_base: int
+            Base for exponential back off delay between retries.
+        max_concurrency: int
+            The maximum number of requests that can be in flight at once.
+        use_cache: bool
+            Whether to reuse responses for prompts that were already sent.
+        max_requests_per_minute: Optional[int]
+            The request rate limit to stay under. None means no limit.
+        max_tokens_per_minute: Optional[int]
+            The token rate limit to stay under. None means no limit.
+        """
+        self.model = model
+        self.encoder = encoder
+        self.max_retries = max_retries
+        self.exp_delay_base = exp_delay_base
+        self.starting_wait_time = starting_wait_time
+        self.max_concurrency = max_concurrency
+        self.use_cache = use_cache
+        self.cache = LLMCache()
+        self.rate_limiter = RateLimiter(max_requests_per_minute, max_tokens_per_minute)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to the event loop it is first used in, and
+        # score_responses starts a new loop on every call, so create one per loop.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    @abstractmethod
+    async def _create_completion(self, messages: List[Dict[str, str]]) -> str:
+        """Sends a single chat completion request and returns the message content"""
+        pass
+
+    async def get_response(
+        self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        """
+        Retrieves a response from the language model
+
+        Parameters
+        ----------
+        prompt: str
+            The prompt to send to the language model.
+        system_prompt: str
+            The system message sent before the prompt. Keeping static instructions
+            here lets providers reuse their cached processing of the prompt prefix.
+
+        Returns
+        -------
+        str
+            The response from the language model.
+        """
+        return await self._get_cached_response(
+            prompt, system_prompt, self._create_completion
+        )
+
+    async def get_boolean_response(
+        self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        """
+        Retrieves a true or false response from the language model. Services that can
+        read the probabilities of the response tokens override this to ask for a
+        single token; by default it is the same as get_response.
+
+        Parameters
+        ----------
+        prompt: str
+            The prompt to send to the language model.
+        system_prompt: str
+            The system message sent before the prompt.
+
+        Returns
+        -------
+        str
+            The response from the language model.
+        """
+        return await self.get_response(prompt, system_prompt)
+
+    async def _get_cached_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        create_completion: Callable[[List[Dict[str, str]]], Awaitable[str]],
+    ) -> str:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+        if not self.use_cache:
+            return await self._get_response(messages, create_completion)
+        key = self.cache.make_key(
+            self.model, create_completion.__name__, system_prompt, prompt
+        )
+        return await self.cache.get_or_compute(
+            key, lambda: self._get_response(messages, create_completion)
+        )
+
+    async def _get_response(
+        self,
+        messages: List[Dict[str, str]],
+        create_completion: Callable[[List[Dict[str, str]]], Awaitable[str]],
+    ) -> str:
+        prompt_tokens = self._estimate_prompt_tokens(messages)
+        num_retries = 0
+        wait_time = self.starting_wait_time
+        while num_retries < self.max_retries:
+            random_value = random.randrange(0, 20) * 0.01
+            wait_time_multiplier = self.exp_delay_base * (1 + random_value)
+            try:
+                await self.rate_limiter.acquire(prompt_tokens)
+                async with self._get_semaphore():
+                    return await create_completion(messages)
+            except BadRequestError as e:
+                if e.code == "context_length_exceeded":
+                    raise ContextLengthException(e.message)
+                raise LLMException(e.message)
+            except RateLimitError:
+                logger.debug(
+                    "hit openai.error.RateLimitError and entered retry "
+                    "logic, num_retries=%s",
+                    num_retries,
+                )
+                # Hold back every request, not just this one, so concurrent
+                # requests do not keep hitting the limit
+                self.rate_limiter.pause(wait_time)
+                await asyncio.sleep(wait_time)
+                wait_time *= wait_time_multiplier
+            except (APIConnectionError, APIStatusError) as e:
+                # Connection errors (including timeouts) are retried, and so are
+                # request timeout, conflict and server error statuses. LiteLLM's 502
+                # and 503 errors are APIStatusErrors rather than InternalServerErrors.
+                if isinstance(e, APIStatusError) and not (
+                    e.status_code >= 500 or e.status_code in RETRYABLE_STATUS_CODES
+                ):
+                    raise LLMException(str(e)) from e
+                logger.warning(e)
+                await asyncio.sleep(wait_time)
+                wait_time *= wait_time_multiplier
+            except LLMException:
+                raise
+            except Exception as e:
+                # Anything else, such as a bad key, an unknown model or an empty
+                # response, will not be fixed by retrying
+                raise LLMException(str(e)) from e
+            num_retries += 1
+        raise LLMException(
+            f"Failed to get completion response from {self.model}, max retires hit"
+        )
+
+    def _estimate_prompt_tokens(self, messages: List[Dict[str, str]]) -> int:
+        # Only needed for the token rate limit, so skip encoding without one
+        if self.rate_limiter.max_tokens_per_minute is None:
+            return 0
+        return sum(self.get_token_counts([message["content"] for message in messages]))
+
+    def get_token_count(self, text: str) -> int:
+        """
+        Gets the token count for the given text using the specified encoder.
+
+        Parameters
+        ----------
+        text: str
+            The text to get the token count for.
+
+        Returns
+        -------
+        int
+            The number of tokens in the text.
+        """
+        return len(self.encoder.encode(text))
+
+    def get_token_counts(self, texts: List[str]) -> List[int]:
+        """
+        Gets the token count for each of the given texts.
+
+        Parameters
+        ----------
+        texts: List[str]
+            The texts to get the token counts for.
+
+        Returns
+        -------
+        List[int]
+            The number of tokens in each text.
+        """
+        # encode_batch starts a new thread pool on every call, which costs more than it
+        # saves for the handful of texts in a prompt
+        return [len(self.encoder.encode(text)) for text in texts]
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from tiktoken import Encoding
+
+from tonic_validate.classes.exceptions import ContextLengthException, LLMException
+from tonic_validate.services.openai_service import OpenAIService
+
+logger = logging.getLogger(__name__)
+
+# Limit on the number of requests in a single batch set by OpenAI
+MAX_BATCH_SIZE = 50000
+BATCH_END_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+class OpenAIBatchService(OpenAIService):
+    def __init__(
+        self,
+        encoder: Encoding,
+        model: str = "gpt-4-1106-preview",
+        batch_window: float = 2.0,
+        poll_interval: float = 30.0,
+        use_cache: bool = True,
+        max_concurrency: int = 50,
+    ) -> None:
+        """
+        Drop-in replacement for OpenAIService that sends requests through the OpenAI
+        Batch API. Batches are cheaper and have separate rate limits, but can take up
+        to 24 hours to complete, so this is only suitable for offline evaluation.
+
+        Requests made within batch_window seconds of each other are grouped into a
+        single batch. Metrics that make several rounds of requests (for example
+        AnswerConsistencyMetric) submit one batch per round. To get every response
+        into the same batch, score with a parallelism at least as large as the number
+        of responses.
+
+        Parameters
+        ----------
+        encoder: Encoding
+            The encoding to use for token count.
+        model: str
+            The model to use for completions.
+        batch_window: float
+            The number of seconds to wait for more requests before submitting a batch.
+        poll_interval: float
+            The number of seconds to wait between checks on the status of a batch.
+        use_cache: bool
+            Whether to reuse responses for prompts that were already sent.
+        max_concurrency: int
+            The maximum number of requests a metric queues at once.
+        """
+        super().__init__(
+            encoder,
+            model,
+            max_concurrency=max_concurrency,
+            use_cache=use_cache,
+            use_logprobs=False,
+        )
+        if not hasattr(self.client, "batches"):
+            raise Exception(
+                "OpenAIBatchService requires a version of the openai package with "
+                "Batch API support. Please upgrade openai."
+            )
+        # The file and batch calls are not wrapped in get_response's retry loop, so
+        # let the client retry them
+        self.client = self.client.with_options(max_retries=2)
+        self.batch_window = batch_window
+        self.poll_interval = poll_interval
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Future] = None
+
+    async def _get_response(
+        self,
+        messages: List[Dict[str, str]],
+        create_completion: Callable[[List[Dict[str, str]]], Awaitable[str]],
+    ) -> str:
+        """Queues a request for the next batch and waits for its response"""
+        request = {
+            "custom_id": str(uuid.uuid4()),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": self.model, "messages": messages, "temperature": 0.0},
+        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self.batch_window)
+        pending, self._pending = self._pending, []
+        # Requests queued from here on start a new batch
+        self._flush_task = None
+        await asyncio.gather(
+            *(
+                self._run_batch(pending[i : i + MAX_BATCH_SIZE])
+                for i in range(0, len(pending), MAX_BATCH_SIZE)
+            )
+        )
+
+    async def _run_batch(
+        self, requests: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        failure_message = "Batch request did not return a result"
+        try:
+            results = await self._submit_batch([request for request, _ in requests])
+            for request, future in requests:
+                if future.done():
+                    continue
+                try:
+                    future.set_result(
+                        self._parse_result(results.get(request["custom_id"]))
+                    )
+                except LLMException as e:
+                    future.set_exception(e)
+                except Exception as e:
+                    future.set_exception(
+                        LLMException(f"Failed to parse batch result: {e!r}")
+                    )
+        except Exception as e:
+            failure_message = f"Batch request failed: {e}"
+        finally:
+            # Never leave a caller waiting on a request that was not resolved
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(LLMException(failure_message))
+
+    async def _submit_batch(
+        self, requests: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Submits the requests as a batch and returns the results by custom_id"""
+        batch_input = "\n".join(json.dumps(request) for request in requests)
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", batch_input.encode("utf-8")), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("Submitted batch %s with %s requests", batch.id, len(requests))
+        while batch.status not in BATCH_END_STATES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        logger.info("Batch %s finished with status %s", batch.id, batch.status)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id is None:
+                continue
+            content = await self.client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    result = json.loads(line)
+                    results[result["custom_id"]] = result
+        return results
+
+    def _parse_result(self, result: Optional[Dict[str, Any]]) -> str:
+        if result is None:
+            raise LLMException(
+                f"Failed to get completion response from {self.model}, batch "
+                "returned no result for the request"
+            )
+        response = result.get("response") or {}
+        body = response.get("body") or {}
+        if response.get("status_code") == 200:
+            content = body["choices"][0]["message"]["content"]
+            if content is None:
+                raise LLMException(
+                    f"Failed to get message response from {self.model}, message does not exist"
+                )
+            return content
+        error = body.get("error") or result.get("error") or {}
+        if error.get("code") == "context_length_exceeded":
+            raise ContextLengthException(error.get("message"))
+        raise LLMException(
+            f"Failed to get completion response from {self.model}: "
+            f"{error.get('message')}"
+        )
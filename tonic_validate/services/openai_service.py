@@ -1,17 +1,24 @@
-import asyncio
 import logging
+import math
 import os
-import random
-from openai import AsyncAzureOpenAI, BadRequestError, AsyncOpenAI, RateLimitError
+import httpx
+from typing import Dict, List, Optional
+from openai import AsyncAzureOpenAI, AsyncOpenAI, BadRequestError
 from tiktoken import Encoding
 
-from tonic_validate.classes.exceptions import ContextLengthException, LLMException
-from tonic_validate.utils.llm_cache import LLMCache
+from tonic_validate.services.llm_service import DEFAULT_SYSTEM_PROMPT, LLMService
 
-logger = logging.getLogger()
+logger = logging.getLogger(__name__)
 
+# Responses to the metric prompts are short, so a request that has not finished in
+# a minute is better retried than waited on
+REQUEST_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
 
-class OpenAIService:
+# The parameters of a boolean request that some models do not support
+LOGPROBS_REQUEST_PARAMS = {"logprobs", "top_logprobs", "max_tokens"}
+
+
+class OpenAIService(LLMService):
     def __init__(
         self,
         encoder: Encoding,
@@ -19,6 +26,11 @@ class OpenAIService:
         starting_wait_time: float = 1.0,
         max_retries: int = 10,
         exp_delay_base: int = 2,
+        max_concurrency: int = 50,
+        use_cache: bool = True,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+        use_logprobs: bool = True,
     ) -> None:
         """
         The OpenAIService class is a wrapper around the OpenAI and AzureOpenAI clients.
@@ -35,98 +47,154 @@ class OpenAIService:
             The maximum number of retries to attempt.
         exp_delay_base: int
             Base for exponential back off delay between retries.
+        max_concurrency: int
+            The maximum number of requests that can be in flight at once.
+        use_cache: bool
+            Whether to reuse responses for prompts that were already sent.
+        max_requests_per_minute: Optional[int]
+            The request rate limit to stay under. None means no limit.
+        max_tokens_per_minute: Optional[int]
+            The token rate limit to stay under. None means no limit.
+        use_logprobs: bool
+            Whether to answer true or false prompts with a single token, picking
+            whichever of true and false has the higher probability. If the model
+            rejects logprobs, returns none, or does not start its response with true
+            or false, a second text request is sent. After a rejection or a response
+            without logprobs, text responses are used from then on.
         """
 
-        # Check if AZURE_OPENAI_API_KEY is set and if so then use AzureOpenAI
         if "AZURE_OPENAI_API_KEY" in os.environ:
             if "AZURE_OPENAI_ENDPOINT" not in os.environ:
                 raise Exception(
                     "AZURE_OPENAI_ENDPOINT must be set in the environment when using AzureOpenAI"
                 )
-            self.client = AsyncAzureOpenAI(api_version="2023-12-01-preview")
+        elif (
+            "OPENAI_API_KEY" not in os.environ and "OPENROUTR_API_KEY" not in os.environ
+        ):
+            raise Exception(
+                "OPENAI_API_KEY or AZURE_OPENAI_API_KEY must be set in the environment"
+            )
+
+        # One long lived connection pool, sized so that every request allowed by
+        # max_concurrency can reuse a kept alive connection
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=REQUEST_TIMEOUT,
+            follow_redirects=True,
+        )
+        # Check if AZURE_OPENAI_API_KEY is set and if so then use AzureOpenAI. Retries
+        # are handled in get_response, so the client itself does not retry.
+        if "AZURE_OPENAI_API_KEY" in os.environ:
+            self.client = AsyncAzureOpenAI(
+                api_version="2023-12-01-preview",
+                http_client=http_client,
+                max_retries=0,
+            )
         elif "OPENAI_API_KEY" in os.environ:
-            self.client = AsyncOpenAI()
-        elif "OPENROUTR_API_KEY" in os.environ:
+            self.client = AsyncOpenAI(http_client=http_client, max_retries=0)
+        else:
             self.client = AsyncOpenAI(
                 base_url="https://openrouter.ai/api/v1",
                 api_key=os.environ["OPENROUTR_API_KEY"],
+                http_client=http_client,
+                max_retries=0,
             )
-        else:
+        super().__init__(
+            encoder,
+            model,
+            starting_wait_time,
+            max_retries,
+            exp_delay_base,
+            max_concurrency,
+            use_cache,
+            max_requests_per_minute,
+            max_tokens_per_minute,
+        )
+        self.use_logprobs = use_logprobs
+
+    async def _create_completion(self, messages: List[Dict[str, str]]) -> str:
+        completion = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,  # type: ignore
+            temperature=0.0,
+        )
+        response = completion.choices[0].message.content
+        if response is None:
             raise Exception(
-                "OPENAI_API_KEY or AZURE_OPENAI_API_KEY must be set in the environment"
+                f"Failed to get message response from {self.model}, message does not exist"
             )
-        self.model = model
-        self.encoder = encoder
-        self.max_retries = max_retries
-        self.exp_delay_base = exp_delay_base
-        self.starting_wait_time = starting_wait_time
-        self.cache = LLMCache()
-
-    async def get_response(self, prompt: str) -> str:
-        """
-        Retrieves a response from the language model
-
-        Parameters
-        ----------
-        prompt: str
-            The prompt to send to the language model.
+        return response
 
-        Returns
-        -------
-        str
-            The response from the language model.
-        """
+    async def get_boolean_response(
+        self, prompt: str, system_prompt: str = DEFAULT_SYSTEM_PROMPT
+    ) -> str:
+        if not self.use_logprobs:
+            return await super().get_boolean_response(prompt, system_prompt)
+        return await self._get_cached_response(
+            prompt, system_prompt, self._create_boolean_completion
+        )
 
-        async def get_openai_response():
-            num_retries = 0
-            wait_time = self.starting_wait_time
-            while num_retries < self.max_retries:
-                random_value = random.randrange(0, 20) * 0.01
-                wait_time_multiplier = self.exp_delay_base * (1 + random_value)
-                try:
-                    completion = await self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a helpful assistant. Respond using markdown.",
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                        temperature=0.0,
-                    )
-                    response = completion.choices[0].message.content
-                    if response is None:
-                        raise Exception(
-                            f"Failed to get message response from {self.model}, message does not exist"
-                        )
-                    return response
-                except BadRequestError as e:
-                    if e.code == "context_length_exceeded":
-                        raise ContextLengthException(e.message)
-                except RateLimitError:
-                    log_message = (
-                        "hit openai.error.RateLimitError and entered retry "
-                        f"logic, num_retries={num_retries}"
-                    )
-                    logger.debug(log_message)
-                    await asyncio.sleep(wait_time)
-                    wait_time *= wait_time_multiplier
-                except Exception as e:
-                    logger.warning(e)
-                    await asyncio.sleep(wait_time)
-                    wait_time *= wait_time_multiplier
-                num_retries += 1
-            raise LLMException(
-                f"Failed to get completion response from {self.model}, max retires hit"
+    async def _create_boolean_completion(self, messages: List[Dict[str, str]]) -> str:
+        try:
+            completion = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,  # type: ignore
+                temperature=0.0,
+                max_tokens=1,
+                logprobs=True,
+                top_logprobs=5,
             )
+        except BadRequestError as e:
+            # Other errors, such as a content filter on a single item, say nothing
+            # about whether the model supports logprobs
+            if (
+                e.code != "unsupported_parameter"
+                and e.param not in LOGPROBS_REQUEST_PARAMS
+            ):
+                raise
+            # Some models and deployments reject logprobs or max_tokens, so stop
+            # asking for them and use text responses from now on
+            logger.warning(
+                "%s rejected a logprobs request, using text responses instead: %s",
+                self.model,
+                e,
+            )
+            self.use_logprobs = False
+            return await self._create_fallback_completion(messages)
+        logprobs = completion.choices[0].logprobs
+        if logprobs is None:
+            # Some providers ignore logprobs instead of rejecting them. Every boolean
+            # prompt would then take two requests, so use text responses from now on
+            logger.warning(
+                "%s did not return logprobs, using text responses instead", self.model
+            )
+            self.use_logprobs = False
+            return await self._create_fallback_completion(messages)
+        true_probability = 0.0
+        false_probability = 0.0
+        if logprobs.content:
+            for top_logprob in logprobs.content[0].top_logprobs:
+                token = top_logprob.token.strip().lower()
+                if token == "true":
+                    true_probability += math.exp(top_logprob.logprob)
+                elif token == "false":
+                    false_probability += math.exp(top_logprob.logprob)
+        if true_probability == 0.0 and false_probability == 0.0:
+            # The first token is not true or false (for example an opening quote),
+            # so ask for the full text response instead
+            logger.debug(
+                "%s did not start its response with true or false, requesting full "
+                "response",
+                self.model,
+            )
+            return await self._create_fallback_completion(messages)
+        return "true" if true_probability > false_probability else "false"
 
-        cached_response = self.cache.get(prompt)
-        if cached_response is not None:
-            return cached_response
-        response = await get_openai_response()
-        self.cache.put(prompt, response)
-        return response
-
-    def get_token_count(self, text: str) -> int:
-        return len(self.encoder.encode(text))
+    async def _create_fallback_completion(self, messages: List[Dict[str, str]]) -> str:
+        # The fallback is a second request sent under the rate limiter slot of the
+        # first, so it takes a slot of its own
+        await self.rate_limiter.acquire(self._estimate_prompt_tokens(messages))
+        return await self._create_completion(messages)
@@ -0,0 +1,17 @@
+import httpx
+
+
+class FakeEncoder:
+    """Splits on whitespace, so tests do not need to download a tiktoken encoding."""
+
+    def encode(self, text):
+        return text.split()
+
+
+def fake_request():
+    return httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def status_error(error_class, status_code, code=None, param=None):
+    response = httpx.Response(status_code, request=fake_request())
+    return error_class("error", response=response, body={"code": code, "param": param})
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from tonic_validate.utils.llm_cache import LLMCache
+
+
+async def test_get_or_compute_caches_value():
+    cache = LLMCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return "response"
+
+    assert await cache.get_or_compute("key", compute) == "response"
+    assert await cache.get_or_compute("key", compute) == "response"
+    assert len(calls) == 1
+
+
+async def test_get_or_compute_shares_in_flight_request():
+    cache = LLMCache()
+    calls = []
+    release = asyncio.Event()
+
+    async def compute():
+        calls.append(1)
+        await release.wait()
+        return "response"
+
+    waiters = [
+        asyncio.ensure_future(cache.get_or_compute("key", compute)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == ["response"] * 5
+    assert len(calls) == 1
+    assert cache.in_flight == {}
+
+
+async def test_get_or_compute_does_not_cache_exception():
+    cache = LLMCache()
+    calls = []
+
+    async def failing_compute():
+        calls.append(1)
+        raise ValueError("failed")
+
+    async def compute():
+        return "response"
+
+    with pytest.raises(ValueError):
+        await cache.get_or_compute("key", failing_compute)
+    assert cache.get("key") is None
+    assert cache.in_flight == {}
+    assert await cache.get_or_compute("key", compute) == "response"
+    assert len(calls) == 1
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_request():
+    cache = LLMCache()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return "response"
+
+    cancelled_waiter = asyncio.ensure_future(cache.get_or_compute("key", compute))
+    waiter = asyncio.ensure_future(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    cancelled_waiter.cancel()
+    release.set()
+    assert await waiter == "response"
+    assert cache.get("key") == "response"
+
+
+def test_put_evicts_least_recently_used():
+    cache = LLMCache(maxsize=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_make_key_separates_parts():
+    assert LLMCache.make_key("model", "ab", "c") != LLMCache.make_key(
+        "model", "a", "bc"
+    )
@@ -0,0 +1,83 @@
+from typing import Dict, List
+
+import litellm
+import openai
+import pytest
+from conftest import FakeEncoder, fake_request, status_error
+from tonic_validate.classes.exceptions import ContextLengthException, LLMException
+from tonic_validate.services.llm_service import LLMService
+
+
+class FakeLLMService(LLMService):
+    def __init__(self, outcomes, **kwargs):
+        super().__init__(FakeEncoder(), "fake-model", 0.0, 3, 2, **kwargs)
+        self.outcomes = outcomes
+        self.num_calls = 0
+
+    async def _create_completion(self, messages: List[Dict[str, str]]) -> str:
+        self.num_calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def connection_error():
+    return openai.APIConnectionError(request=fake_request())
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        status_error(openai.RateLimitError, 429),
+        status_error(openai.InternalServerError, 500),
+        status_error(openai.APIStatusError, 408),
+        status_error(openai.APIStatusError, 409),
+        connection_error(),
+        litellm.ServiceUnavailableError("overloaded", "bedrock", "fake-model"),
+        litellm.BadGatewayError("bad gateway", "bedrock", "fake-model"),
+    ],
+)
+async def test_transient_errors_are_retried(error):
+    service = FakeLLMService([error, "response"])
+    assert await service.get_response("prompt") == "response"
+    assert service.num_calls == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        status_error(openai.UnprocessableEntityError, 422),
+        status_error(openai.AuthenticationError, 401),
+        status_error(openai.BadRequestError, 400),
+        Exception("message does not exist"),
+    ],
+)
+async def test_other_errors_are_not_retried(error):
+    service = FakeLLMService([error, "response"])
+    with pytest.raises(LLMException):
+        await service.get_response("prompt")
+    assert service.num_calls == 1
+
+
+async def test_context_length_error_is_raised():
+    service = FakeLLMService(
+        [status_error(openai.BadRequestError, 400, "context_length_exceeded")]
+    )
+    with pytest.raises(ContextLengthException):
+        await service.get_response("prompt")
+
+
+async def test_max_retries_raises():
+    service = FakeLLMService([status_error(openai.InternalServerError, 500)] * 3)
+    with pytest.raises(LLMException):
+        await service.get_response("prompt")
+    assert service.num_calls == 3
+
+
+async def test_responses_are_cached_by_prompt():
+    service = FakeLLMService(["first", "second", "third"])
+    assert await service.get_response("a") == "first"
+    assert await service.get_response("a") == "first"
+    assert await service.get_response("a", system_prompt="other") == "second"
+    assert service.num_calls == 2
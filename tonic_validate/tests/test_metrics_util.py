@@ -0,0 +1,83 @@
+import pytest
+from tonic_validate.utils.metrics_util import (
+    parse_boolean_response,
+    parse_bullet_list_response,
+    parse_main_points_with_derivation_response,
+)
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '[{"point": "Fido is a dog", "derived": true}, '
+        '{"point": "Rex is a cat", "derived": false}]',
+        '```json\n[{"point": "Fido is a dog", "derived": true}, '
+        '{"point": "Rex is a cat", "derived": false}]\n```',
+        '```\n[{"point": "Fido is a dog", "derived": "true"}, '
+        '{"point": "Rex is a cat", "derived": "false"}]\n```',
+    ],
+)
+def test_parse_main_points_with_derivation_response(response):
+    assert parse_main_points_with_derivation_response(response) == [
+        ("Fido is a dog", True),
+        ("Rex is a cat", False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "* Fido is a dog",
+        "[]",
+        '{"point": "Fido is a dog", "derived": true}',
+        '[{"point": "Fido is a dog"}]',
+    ],
+)
+def test_parse_main_points_with_derivation_response_invalid(response):
+    with pytest.raises(ValueError):
+        parse_main_points_with_derivation_response(response)
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "* Fido is a dog\n* Rex is a cat",
+        "Main points:\n* Fido is a dog\n* Rex is a cat",
+        "- Fido is a dog\n- Rex is a cat",
+    ],
+)
+def test_parse_bullet_list_response(response):
+    assert parse_bullet_list_response(response) == ["Fido is a dog", "Rex is a cat"]
+
+
+def test_parse_bullet_list_response_invalid():
+    with pytest.raises(ValueError):
+        parse_bullet_list_response("Fido is a dog")
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ("true", True),
+        ("True", True),
+        (" TRUE\n", True),
+        ("'true'", True),
+        ('"false".', False),
+        ("yes", True),
+        ("Y", True),
+        ("1", True),
+        ("no", False),
+        ("n", False),
+        ("0", False),
+        ("The answer is true", True),
+        ("The answer is false", False),
+    ],
+)
+def test_parse_boolean_response(response, expected):
+    assert parse_boolean_response(response) is expected
+
+
+@pytest.mark.parametrize("response", ["maybe", "true or false", ""])
+def test_parse_boolean_response_ambiguous(response):
+    with pytest.raises(ValueError):
+        parse_boolean_response(response)
@@ -0,0 +1,186 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from conftest import FakeEncoder
+from tonic_validate.classes.exceptions import ContextLengthException, LLMException
+from tonic_validate.services.openai_batch_service import OpenAIBatchService
+
+
+def success_result(custom_id, content):
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {"choices": [{"message": {"content": content}}]},
+        },
+    }
+
+
+def error_result(custom_id, code, message):
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 400,
+            "body": {"error": {"code": code, "message": message}},
+        },
+    }
+
+
+class FakeFiles:
+    def __init__(self, results):
+        self.results = results
+        self.uploaded = []
+
+    async def create(self, file, purpose):
+        self.uploaded.append(file[1].decode("utf-8"))
+        return SimpleNamespace(id="input-file")
+
+    async def content(self, file_id):
+        requests = [json.loads(line) for line in self.uploaded[-1].splitlines()]
+        # Successful results go in the output file and failed ones in the error file
+        want_success = file_id == "output-file"
+        lines = []
+        for request in requests:
+            result = self.results(request)
+            if result is None:
+                continue
+            if (result["response"]["status_code"] == 200) == want_success:
+                lines.append(json.dumps(result))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class FakeBatches:
+    def __init__(self):
+        self.retrieve_count = 0
+
+    async def create(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch", status="validating")
+
+    async def retrieve(self, batch_id):
+        self.retrieve_count += 1
+        return SimpleNamespace(
+            id=batch_id,
+            status="completed",
+            output_file_id="output-file",
+            error_file_id="error-file",
+        )
+
+
+@pytest.fixture
+def batch_service(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+    return OpenAIBatchService(
+        FakeEncoder(), batch_window=0.0, poll_interval=0.0, use_cache=False
+    )
+
+
+def use_fake_client(batch_service, results):
+    files = FakeFiles(results)
+    batches = FakeBatches()
+    batch_service.client = SimpleNamespace(files=files, batches=batches)
+    return files, batches
+
+
+def user_prompt(request):
+    return request["body"]["messages"][1]["content"]
+
+
+async def test_responses_are_routed_by_custom_id(batch_service):
+    files, batches = use_fake_client(
+        batch_service,
+        lambda request: success_result(
+            request["custom_id"], f"response to {user_prompt(request)}"
+        ),
+    )
+    responses = await asyncio.gather(
+        *(batch_service.get_response(f"prompt {i}") for i in range(3))
+    )
+    assert responses == [f"response to prompt {i}" for i in range(3)]
+    assert len(files.uploaded) == 1
+    assert batches.retrieve_count == 1
+
+
+async def test_errors_are_routed_by_custom_id(batch_service):
+    def results(request):
+        prompt = user_prompt(request)
+        if prompt == "too long":
+            return error_result(
+                request["custom_id"], "context_length_exceeded", "too many tokens"
+            )
+        if prompt == "invalid":
+            return error_result(request["custom_id"], "invalid_request", "bad")
+        if prompt == "missing":
+            return None
+        return success_result(request["custom_id"], "ok")
+
+    use_fake_client(batch_service, results)
+    responses = await asyncio.gather(
+        *(
+            batch_service.get_response(prompt)
+            for prompt in ["valid", "too long", "invalid", "missing"]
+        ),
+        return_exceptions=True,
+    )
+    assert responses[0] == "ok"
+    assert isinstance(responses[1], ContextLengthException)
+    assert isinstance(responses[2], LLMException)
+    assert not isinstance(responses[2], ContextLengthException)
+    assert isinstance(responses[3], LLMException)
+
+
+async def test_failed_submission_fails_every_request(batch_service):
+    async def failing_submit(requests):
+        raise RuntimeError("upload failed")
+
+    batch_service._submit_batch = failing_submit
+    responses = await asyncio.gather(
+        batch_service.get_response("a"),
+        batch_service.get_response("b"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(response, LLMException) for response in responses)
+
+
+async def test_requests_after_flush_start_a_new_batch(batch_service):
+    files, _ = use_fake_client(
+        batch_service,
+        lambda request: success_result(request["custom_id"], "ok"),
+    )
+    assert await batch_service.get_response("first") == "ok"
+    assert await batch_service.get_response("second") == "ok"
+    assert len(files.uploaded) == 2
+
+
+@pytest.mark.parametrize(
+    "body",
+    [{}, {"choices": []}, {"choices": [{"message": None}]}],
+)
+async def test_malformed_result_fails_only_its_request(batch_service, body):
+    def results(request):
+        if user_prompt(request) == "malformed":
+            return {
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": body},
+            }
+        return success_result(request["custom_id"], "ok")
+
+    use_fake_client(batch_service, results)
+    responses = await asyncio.wait_for(
+        asyncio.gather(
+            batch_service.get_response("malformed"),
+            batch_service.get_response("valid"),
+            return_exceptions=True,
+        ),
+        timeout=5,
+    )
+    assert isinstance(responses[0], LLMException)
+    assert responses[1] == "ok"
+
+
+def test_parse_result_rejects_empty_content(batch_service):
+    result = success_result("id", None)
+    with pytest.raises(LLMException):
+        batch_service._parse_result(result)
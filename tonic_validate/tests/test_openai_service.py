@@ -0,0 +1,161 @@
+import math
+from types import SimpleNamespace
+
+import openai
+import pytest
+from conftest import FakeEncoder, status_error
+from tonic_validate.classes.exceptions import ContextLengthException, LLMException
+from tonic_validate.services.openai_service import OpenAIService
+
+
+class FakeCompletions:
+    def __init__(self, top_logprobs=None, text="true", logprobs_error=None):
+        self.top_logprobs = top_logprobs
+        self.text = text
+        self.logprobs_error = logprobs_error
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        logprobs = None
+        if kwargs.get("logprobs"):
+            if self.logprobs_error is not None:
+                raise self.logprobs_error
+            if self.top_logprobs is not None:
+                logprobs = SimpleNamespace(
+                    content=[
+                        SimpleNamespace(
+                            top_logprobs=[
+                                SimpleNamespace(token=token, logprob=math.log(p))
+                                for token, p in self.top_logprobs
+                            ]
+                        )
+                    ]
+                )
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content=self.text), logprobs=logprobs
+                )
+            ]
+        )
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+
+    def make_service(completions, **kwargs):
+        service = OpenAIService(FakeEncoder(), max_retries=1, **kwargs)
+        service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return service
+
+    return make_service
+
+
+@pytest.mark.parametrize(
+    "top_logprobs, expected",
+    [
+        ([("true", 0.9), ("false", 0.1)], "true"),
+        ([("false", 0.6), ("true", 0.3)], "false"),
+        # Variants of the same word are added together
+        ([("false", 0.4), ("true", 0.3), ("True", 0.1), (" true", 0.1)], "true"),
+        ([("false", 0.2), ("maybe", 0.8)], "false"),
+    ],
+)
+async def test_boolean_response_uses_most_likely_token(
+    make_service, top_logprobs, expected
+):
+    completions = FakeCompletions(top_logprobs=top_logprobs, text="unused")
+    service = make_service(completions)
+    assert await service.get_boolean_response("prompt") == expected
+    assert len(completions.requests) == 1
+    assert completions.requests[0]["max_tokens"] == 1
+    assert completions.requests[0]["top_logprobs"] == 5
+
+
+async def test_boolean_response_falls_back_to_text(make_service):
+    completions = FakeCompletions(top_logprobs=[("'", 0.9), ('"', 0.1)], text="'true'")
+    service = make_service(completions)
+    assert await service.get_boolean_response("prompt") == "'true'"
+    assert len(completions.requests) == 2
+    assert "logprobs" not in completions.requests[1]
+    assert service.use_logprobs
+
+
+async def test_missing_logprobs_fall_back_to_text_from_then_on(make_service):
+    completions = FakeCompletions(top_logprobs=None, text="true")
+    service = make_service(completions)
+    assert await service.get_boolean_response("first prompt") == "true"
+    assert not service.use_logprobs
+    assert await service.get_boolean_response("second prompt") == "true"
+    assert [request.get("logprobs") for request in completions.requests] == [
+        True,
+        None,
+        None,
+    ]
+
+
+async def test_fallback_request_takes_a_rate_limiter_slot(make_service):
+    completions = FakeCompletions(top_logprobs=[("'", 1.0)], text="true")
+    service = make_service(completions)
+    acquired = []
+
+    async def acquire(num_tokens):
+        acquired.append(num_tokens)
+
+    service.rate_limiter.acquire = acquire
+    await service.get_boolean_response("prompt")
+    assert len(acquired) == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        status_error(openai.BadRequestError, 400, "unsupported_parameter"),
+        status_error(openai.BadRequestError, 400, "invalid_request_error", "logprobs"),
+        status_error(openai.BadRequestError, 400, None, "max_tokens"),
+    ],
+)
+async def test_rejected_logprobs_fall_back_to_text_from_then_on(make_service, error):
+    completions = FakeCompletions(text="false", logprobs_error=error)
+    service = make_service(completions)
+    assert await service.get_boolean_response("first prompt") == "false"
+    assert not service.use_logprobs
+    assert await service.get_boolean_response("second prompt") == "false"
+    assert [request.get("logprobs") for request in completions.requests] == [
+        True,
+        None,
+        None,
+    ]
+
+
+async def test_context_length_error_is_not_a_logprobs_rejection(make_service):
+    completions = FakeCompletions(
+        logprobs_error=status_error(
+            openai.BadRequestError, 400, "context_length_exceeded"
+        )
+    )
+    service = make_service(completions)
+    with pytest.raises(ContextLengthException):
+        await service.get_boolean_response("prompt")
+    assert service.use_logprobs
+
+
+async def test_content_filter_error_does_not_turn_off_logprobs(make_service):
+    completions = FakeCompletions(
+        logprobs_error=status_error(openai.BadRequestError, 400, "content_filter")
+    )
+    service = make_service(completions)
+    with pytest.raises(LLMException):
+        await service.get_boolean_response("prompt")
+    assert service.use_logprobs
+    assert len(completions.requests) == 1
+
+
+async def test_use_logprobs_off_sends_text_request(make_service):
+    completions = FakeCompletions(top_logprobs=[("false", 1.0)], text="true")
+    service = make_service(completions, use_logprobs=False)
+    assert await service.get_boolean_response("prompt") == "true"
+    assert "logprobs" not in completions.requests[0]
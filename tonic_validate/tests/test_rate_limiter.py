@@ -0,0 +1,104 @@
+from types import SimpleNamespace
+
+import pytest
+from tonic_validate.utils import rate_limiter as rate_limiter_module
+from tonic_validate.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(
+        rate_limiter_module, "time", SimpleNamespace(monotonic=clock.monotonic)
+    )
+    monkeypatch.setattr(
+        rate_limiter_module, "asyncio", SimpleNamespace(sleep=clock.sleep)
+    )
+    return clock
+
+
+async def test_no_limits_never_waits(clock):
+    limiter = RateLimiter()
+    for _ in range(100):
+        await limiter.acquire(1000)
+    assert clock.sleeps == []
+
+
+async def test_request_limit_waits_for_refill(clock):
+    limiter = RateLimiter(max_requests_per_minute=60)
+    for _ in range(60):
+        await limiter.acquire(0)
+    assert clock.sleeps == []
+
+    await limiter.acquire(0)
+    # One request refills every second at 60 requests per minute
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert clock.now == pytest.approx(1.0)
+
+
+async def test_token_limit_waits_for_refill(clock):
+    limiter = RateLimiter(max_tokens_per_minute=600)
+    await limiter.acquire(600)
+    assert clock.sleeps == []
+
+    await limiter.acquire(100)
+    # 100 tokens refill in 10 seconds at 600 tokens per minute
+    assert clock.now == pytest.approx(10.0)
+
+
+async def test_capacity_refills_while_idle(clock):
+    limiter = RateLimiter(max_requests_per_minute=60)
+    for _ in range(60):
+        await limiter.acquire(0)
+    clock.now += 30
+    for _ in range(30):
+        await limiter.acquire(0)
+    assert clock.sleeps == []
+
+
+async def test_capacity_does_not_exceed_limit(clock):
+    limiter = RateLimiter(max_requests_per_minute=60)
+    clock.now += 600
+    for _ in range(60):
+        await limiter.acquire(0)
+    await limiter.acquire(0)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+async def test_request_larger_than_token_limit_does_not_wait_forever(clock):
+    limiter = RateLimiter(max_tokens_per_minute=100)
+    await limiter.acquire(1000)
+    assert clock.sleeps == []
+    await limiter.acquire(1000)
+    assert clock.now == pytest.approx(60.0)
+
+
+async def test_pause_holds_back_requests(clock):
+    limiter = RateLimiter()
+    limiter.pause(5)
+    await limiter.acquire(0)
+    assert clock.now == pytest.approx(5.0)
+
+    await limiter.acquire(0)
+    assert clock.sleeps == [pytest.approx(5.0)]
+
+
+async def test_pause_keeps_longest_pause(clock):
+    limiter = RateLimiter()
+    limiter.pause(5)
+    limiter.pause(2)
+    await limiter.acquire(0)
+    assert clock.now == pytest.approx(5.0)
@@ -1,10 +1,19 @@
+import asyncio
+import hashlib
 from collections import OrderedDict
+from typing import Awaitable, Callable, Dict
 
 
 class LLMCache:
-    def __init__(self, maxsize=512):
+    def __init__(self, maxsize=4096):
         self.maxsize = maxsize
         self.cache = OrderedDict()
+        self.in_flight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hashes the parts of a request (model, prompts) into a fixed size key."""
+        return hashlib.blake2b("\0".join(parts).encode("utf-8")).hexdigest()
 
     def get(self, key):
         if key in self.cache:
@@ -18,3 +27,27 @@ class LLMCache:
         self.cache[key] = value
         if len(self.cache) > self.maxsize:
             self.cache.popitem(last=False)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[str]]):
+        """
+        Returns the cached value for key, computing and caching it if needed.
+
+        Concurrent callers asking for a key that is already being computed wait
+        for that computation instead of sending the same request again.
+        """
+        cached_value = self.get(key)
+        if cached_value is not None:
+            return cached_value
+
+        task = self.in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(compute())
+            self.in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future):
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
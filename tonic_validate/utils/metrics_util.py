@@ -1,8 +1,16 @@
+import json
 import logging
-from typing import List
+import re
+from typing import Any, List, Tuple
 
 logger = logging.getLogger()
 
+_TRUE = frozenset({"true", "yes", "y", "1"})
+_FALSE = frozenset({"false", "no", "n", "0"})
+
+# Matches a markdown code fence wrapped around the whole response
+_CODE_FENCE = re.compile(r"^```[a-zA-Z]*\s*(.*?)\s*```$", re.DOTALL)
+
 
 def parse_boolean_response(response: str) -> bool:
     """Parse boolean response from LLM evaluator.
@@ -19,10 +27,10 @@ def parse_boolean_response(response: str) -> bool:
     bool
         Whether response should be interpreted as true or false.
     """
-    response_lower = response.lower()
-    if response_lower == "true":
+    response_lower = response.strip().strip("'\".").lower()
+    if response_lower in _TRUE:
         return True
-    if response_lower == "false":
+    if response_lower in _FALSE:
         return False
     logger.debug(f"Relevance response {response_lower} is not true or false")
     if "true" in response_lower and "false" not in response_lower:
@@ -70,3 +78,46 @@ def parse_bullet_list_response(response: str) -> List[str]:
     except ValueError:
         result = get_bullet_list("-")
     return result
+
+
+def parse_main_points_with_derivation_response(response: str) -> List[Tuple[str, bool]]:
+    """Parse main points with derivation response from LLM evaluator.
+
+    Attempts to parse response as a JSON array of objects with a "point" and a
+    "derived" key, ignoring a markdown code fence around the array.
+
+    Parameters
+    ----------
+    response: str
+        Response from LLM evaluator.
+
+    Returns
+    -------
+    List[Tuple[str, bool]]
+        List of main points and whether each is derived from the context.
+    """
+    response = _strip_code_fence(response)
+    try:
+        parsed_response: Any = json.loads(response)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Could not parse JSON from response {response}") from e
+    if not isinstance(parsed_response, list) or len(parsed_response) == 0:
+        raise ValueError(f"Could not parse list from response {response}")
+
+    main_points: List[Tuple[str, bool]] = []
+    for item in parsed_response:
+        if not isinstance(item, dict) or "derived" not in item:
+            raise ValueError(f"Could not parse main point {item} from response")
+        derived = item["derived"]
+        if not isinstance(derived, bool):
+            derived = parse_boolean_response(str(derived))
+        main_points.append((str(item.get("point", "")).strip(), derived))
+    return main_points
+
+
+def _strip_code_fence(response: str) -> str:
+    response = response.strip()
+    code_fence_match = _CODE_FENCE.match(response)
+    if code_fence_match is not None:
+        return code_fence_match.group(1)
+    return response
@@ -0,0 +1,28 @@
+import asyncio
+from typing import Awaitable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(coros: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """Run awaitables concurrently with at most `limit` of them running at once.
+
+    Parameters
+    ----------
+    coros: Iterable[Awaitable[T]]
+        The awaitables to run.
+    limit: int
+        The maximum number of awaitables that can run at the same time.
+
+    Returns
+    -------
+    List[T]
+        The results, in the same order as `coros`.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        """
+        Token bucket limiter for requests per minute and tokens per minute. Both
+        buckets start full and refill continuously at their per minute rate. With no
+        limits set, it only holds requests back while paused.
+
+        Parameters
+        ----------
+        max_requests_per_minute: Optional[float]
+            The maximum number of requests per minute. None means no limit.
+        max_tokens_per_minute: Optional[float]
+            The maximum number of tokens per minute. None means no limit.
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = max_requests_per_minute or 0.0
+        self.available_token_capacity = max_tokens_per_minute or 0.0
+        self.last_update_time = time.monotonic()
+        self.paused_until = self.last_update_time
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        minutes_elapsed = (now - self.last_update_time) / 60
+        self.last_update_time = now
+        if self.max_requests_per_minute is not None:
+            self.available_request_capacity = min(
+                self.max_requests_per_minute,
+                self.available_request_capacity
+                + self.max_requests_per_minute * minutes_elapsed,
+            )
+        if self.max_tokens_per_minute is not None:
+            self.available_token_capacity = min(
+                self.max_tokens_per_minute,
+                self.available_token_capacity
+                + self.max_tokens_per_minute * minutes_elapsed,
+            )
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds back every request for the given number of seconds. Used after a rate
+        limit error, when all other requests would most likely hit the limit too.
+
+        Parameters
+        ----------
+        seconds: float
+            The number of seconds to hold back requests for.
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def _seconds_until_available(self, num_tokens: float) -> float:
+        wait_time = self.paused_until - self.last_update_time
+        if self.max_requests_per_minute is not None:
+            missing_requests = 1 - self.available_request_capacity
+            wait_time = max(
+                wait_time, 60 * missing_requests / self.max_requests_per_minute
+            )
+        if self.max_tokens_per_minute is not None:
+            missing_tokens = num_tokens - self.available_token_capacity
+            wait_time = max(wait_time, 60 * missing_tokens / self.max_tokens_per_minute)
+        return wait_time
+
+    async def acquire(self, num_tokens: int) -> None:
+        """
+        Waits until there is capacity for one request using num_tokens tokens and
+        then consumes that capacity.
+
+        Parameters
+        ----------
+        num_tokens: int
+            The estimated number of tokens the request will use.
+        """
+        if self.max_tokens_per_minute is not None:
+            # A request larger than the whole bucket would otherwise wait forever
+            num_tokens = min(num_tokens, int(self.max_tokens_per_minute))
+        while True:
+            self._refill()
+            wait_time = self._seconds_until_available(num_tokens)
+            if wait_time <= 0:
+                break
+            await asyncio.sleep(wait_time)
+        if self.max_requests_per_minute is not None:
+            self.available_request_capacity -= 1
+        if self.max_tokens_per_minute is not None:
+            self.available_token_capacity -= num_tokens
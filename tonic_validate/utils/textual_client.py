@@ -0,0 +1,35 @@
+import os
+from typing import Any, Dict, Optional
+
+TEXTUAL_URL = "https://textual.tonic.ai"
+
+# Clients are shared by API key so that metrics created with the same key reuse
+# one client and its connections
+_textual_clients: Dict[str, Any] = {}
+
+
+def get_textual_client(textual_api_key: Optional[str] = None) -> Any:
+    """Returns the shared Tonic Textual client for the given API key.
+
+    Parameters
+    ----------
+    textual_api_key: Optional[str]
+        The Textual API key. If None, TONIC_TEXTUAL_API_KEY from the environment is
+        used.
+
+    Returns
+    -------
+    TonicTextual
+        The Textual client.
+    """
+    from tonic_textual.redact_api import TonicTextual  # type: ignore
+
+    # Resolve the environment key here so a changed TONIC_TEXTUAL_API_KEY gets a new
+    # client rather than the one cached for the old key
+    api_key = textual_api_key or os.environ.get("TONIC_TEXTUAL_API_KEY")
+    if api_key is None:
+        # Let TonicTextual raise its usual error for a missing key
+        return TonicTextual(TEXTUAL_URL)
+    if api_key not in _textual_clients:
+        _textual_clients[api_key] = TonicTextual(TEXTUAL_URL, api_key)
+    return _textual_clients[api_key]
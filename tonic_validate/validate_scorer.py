@@ -2,7 +2,17 @@ from asyncio import Semaphore
 import asyncio
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Awaitable, Callable, DefaultDict, List, Dict, Type, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    List,
+    Dict,
+    Optional,
+    Type,
+    Union,
+)
 
 from pydantic import ConfigDict, TypeAdapter, validate_call
 from tonic_validate.classes.benchmark import Benchmark, BenchmarkItem
@@ -13,6 +23,7 @@ from tonic_validate.classes.llm_response import CallbackLLMResponse, LLMResponse
 from tonic_validate.classes.run import Run, RunData
 import tonic_validate.metrics as tonic_metrics
 from tonic_validate.services.openai_service import OpenAIService
+from tonic_validate.services.openai_batch_service import OpenAIBatchService
 from tonic_validate.services.litellm_service import LiteLLMService
 import tiktoken
 from tonic_validate.utils.telemetry import Telemetry
@@ -53,6 +64,11 @@ class ValidateScorer:
         fail_on_error: bool = False,
         quiet: bool = False,
         model_id: str = "",
+        max_llm_concurrency: int = 50,
+        use_batch_api: bool = False,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+        use_logprobs: bool = True,
     ):
         """
         Create a Tonic Validate scorer that can work with either OpenAIService or LiteLLMService.
@@ -71,11 +87,27 @@ class ValidateScorer:
             If True, an error in calculating a metric will raise an exception. If False, the score will be set to None.
         quiet: bool
             If True, will suppress all logging except errors.
+        max_llm_concurrency: int
+            The maximum number of llm requests that can be in flight at once.
+        use_batch_api: bool
+            If True, send requests through the OpenAI Batch API. This is cheaper but
+            can take up to 24 hours. Only supported for OpenAI models. max_llm_retries,
+            max_requests_per_minute, max_tokens_per_minute and use_logprobs do not
+            apply to batch requests.
+        max_requests_per_minute: Optional[int]
+            If set, llm requests are throttled to stay under this many requests per minute.
+        max_tokens_per_minute: Optional[int]
+            If set, llm requests are throttled to stay under this many tokens per minute.
+        use_logprobs: bool
+            If True, true or false prompts are answered with a single token using
+            logprobs. Only used for OpenAI models. Models that reject or ignore logprobs
+            fall back to text responses automatically.
         """
         self.metrics = metrics
         self.model_evaluator = model_evaluator
         self.max_parsing_retries = max_parsing_retries
         self.max_llm_retries = max_llm_retries
+        self.max_llm_concurrency = max_llm_concurrency
         self.fail_on_error = fail_on_error
         self.quiet = quiet
         self.telemetry = Telemetry()
@@ -97,16 +129,80 @@ class ValidateScorer:
             or model_name_lower.startswith("bedrock")
             or model_name_lower.startswith("sagemaker")
         ):
+            if use_batch_api:
+                raise ValueError(
+                    f"use_batch_api is only supported for OpenAI models, not {self.model_evaluator}"
+                )
             self.llm_service = LiteLLMService(
                 self.encoder,
                 self.model_evaluator,
                 max_retries=self.max_llm_retries,
                 model_id=model_id,
+                max_concurrency=self.max_llm_concurrency,
+                max_requests_per_minute=max_requests_per_minute,
+                max_tokens_per_minute=max_tokens_per_minute,
+            )
+        elif use_batch_api:
+            # Batch requests are not rate limited or retried by the service, so only
+            # the concurrency setting applies
+            self.llm_service = OpenAIBatchService(
+                self.encoder,
+                self.model_evaluator,
+                max_concurrency=self.max_llm_concurrency,
             )
         else:
             self.llm_service = OpenAIService(
-                self.encoder, self.model_evaluator, max_retries=self.max_llm_retries
+                self.encoder,
+                self.model_evaluator,
+                max_retries=self.max_llm_retries,
+                max_concurrency=self.max_llm_concurrency,
+                max_requests_per_minute=max_requests_per_minute,
+                max_tokens_per_minute=max_tokens_per_minute,
+                use_logprobs=use_logprobs,
+            )
+
+    async def _score_metric(
+        self, metric: tonic_metrics.Metric, response: LLMResponse
+    ) -> Union[float, None]:
+        """
+        Calculates the score of a single metric for a single LLMResponse object,
+        retrying if the LLM response could not be parsed
+
+        Parameters
+        ----------
+        metric: Metric
+            The metric to calculate
+        response: LLMResponse
+            The LLMResponse object to calculate the score for
+
+        Returns
+        -------
+        Union[float, None]
+            The score, or None if it could not be calculated
+        """
+        tries = 0
+        exceptions = []
+        while tries < self.max_parsing_retries:
+            try:
+                return await metric.score(response, self.llm_service)
+            except LLMException as e:
+                if self.fail_on_error:
+                    raise Exception("Error getting LLM response: " + str(e))
+                logger.warning(
+                    f"Error getting LLM response. Setting score to None. {e}"
+                )
+                return None
+            except Exception as e:
+                tries += 1
+                logger.warning(f"Error calculating {metric.name}: {e}. Retrying...")
+                exceptions.append(e)
+
+        if self.fail_on_error:
+            raise Exception(
+                f"Error calculating metric {metric.name}: " + str(exceptions)
             )
+        logger.warning(f"Error calculating {metric.name}. Setting score to None.")
+        return None
 
     @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
     async def _score_item_rundata(
@@ -126,41 +222,22 @@ class ValidateScorer:
             Contains the scores and other data
         """
         async with semaphore:
-            scores: Dict[str, Union[float, None]] = {}
-            for metric in self.metrics:
-                tries = 0
-                exceptions = []
-                while tries < self.max_parsing_retries:
-                    try:
-                        scores[metric.name] = await metric.score(
-                            response, self.llm_service
-                        )
-                        break
-                    except LLMException as e:
-                        if self.fail_on_error:
-                            raise Exception("Error getting LLM response: " + str(e))
-                        scores[metric.name] = None
-                        logger.warning(
-                            f"Error getting LLM response. Setting score to None. {e}"
-                        )
-                        break
-                    except Exception as e:
-                        tries += 1
-                        logger.warning(
-                            f"Error calculating {metric.name}: {e}. Retrying..."
-                        )
-                        exceptions.append(e)
-
-                if tries == self.max_parsing_retries:
-                    if self.fail_on_error:
-                        raise Exception(
-                            f"Error calculating metric {metric.name}: "
-                            + str(exceptions)
-                        )
-                    scores[metric.name] = None
-                    logger.warning(
-                        f"Error calculating {metric.name}. Setting score to None."
-                    )
+            # The metrics are independent, so score them concurrently. The LLM
+            # service bounds how many requests are in flight.
+            tasks = [
+                asyncio.ensure_future(self._score_metric(metric, response))
+                for metric in self.metrics
+            ]
+            try:
+                metric_scores = await asyncio.gather(*tasks)
+            finally:
+                # With fail_on_error, stop the other metrics from sending more
+                # requests once one has failed
+                for task in tasks:
+                    task.cancel()
+            scores: Dict[str, Union[float, None]] = {
+                metric.name: score for metric, score in zip(self.metrics, metric_scores)
+            }
             benchmark_item = response.benchmark_item
             return RunData(
                 scores=scores,